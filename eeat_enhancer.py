@@ -10,6 +10,7 @@ This system enhances articles to meet E-E-A-T standards by:
 4. TRUSTWORTHINESS: Ensuring accuracy, transparency, and reliable sources
 """
 
+import os
 import json
 import re
 from datetime import datetime, timedelta
@@ -385,8 +386,16 @@ Our editorial team employs a rigorous research methodology:
                 enhanced_articles.append(article)  # Keep original if enhancement fails
         
         print(f"Saving enhanced articles to {output_file}...")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(enhanced_articles, f, indent=2, ensure_ascii=False)
+        # Write to a temp file and swap it in, so a crash mid-dump never leaves a truncated file
+        tmp_file = output_file + '.tmp'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(enhanced_articles, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, output_file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.unlink(tmp_file)
+            raise
         
         print(f"✅ Successfully enhanced {len(enhanced_articles)} articles with E-E-A-T elements!")
         
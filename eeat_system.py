@@ -18,278 +18,434 @@ Usage:
 import json
 import os
 import re
-import shutil
-import markdown
-import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+# Articles handed to the process pool per round when streaming a file
+STREAM_BATCH_SIZE = 256
+# Output buffer for the large enhanced JSON; keeps write() syscalls to ~1 per MiB
+WRITE_BUFFER_SIZE = 1 << 20
+
+def _json_loads(data):
+    """Parse JSON from str/bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj) -> str:
+    """Serialize to a 2-space indented JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+def _iter_json_array(path: str) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array, streaming with ijson when it is installed."""
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    else:
+        with open(path, 'rb') as f:
+            yield from _json_loads(f.read())
+
+def _json_item_bytes(obj) -> bytes:
+    """Serialize one array item as indented UTF-8 JSON (non-ASCII characters kept as-is)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _atomic_open(path: str):
+    """
+    Open a temp file in path's directory for binary writing.
+    Returns (file, temp_path); the caller os.replace()s it into place or unlinks it on failure.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                    prefix=os.path.basename(path) + '.', suffix='.tmp')
+    return os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE), tmp_path
+
+def _write_json_array(items: Iterable[Any], path: str) -> int:
+    """
+    Write items to path as an indented JSON array, one item at a time.
+    Produces the same layout as dumping the whole list with indent=2. Returns the item count.
+    The array is written to a temp file and swapped in with os.replace, so path may also
+    be the file the items are being streamed from.
+    """
+    count = 0
+    f, tmp_path = _atomic_open(path)
+    try:
+        with f:
+            f.write(b'[')
+            for item in items:
+                f.write(b',\n  ' if count else b'\n  ')
+                # Newlines inside strings are escaped, so every raw newline is structural
+                f.write(_json_item_bytes(item).replace(b'\n', b'\n  '))
+                count += 1
+            f.write(b'\n]\n' if count else b']\n')
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
+
+def _write_text_atomic(text: str, path: str):
+    """Write a UTF-8 text file via a temp file and os.replace."""
+    f, tmp_path = _atomic_open(path)
+    try:
+        with f:
+            f.write(text.encode('utf-8'))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+# Category consolidation mapping
+_CATEGORY_MAPPING = MappingProxyType({
+    # Business categories
+    "Business": "Business",
+    "Business & International Relations": "Business", 
+    "Business and Technology": "Business",
+    "Economy": "Business",
+    "Finance": "Business",
+
+    # Technology categories  
+    "Technology": "Technology",
+
+    # Sports categories
+    "Sports": "Sports",
+
+    # News categories
+    "News": "News",
+    "Defence": "News",
+    "Defense": "News",
+    "Environment": "News",
+    "Energy": "News",
+
+    # Education categories (will be in More dropdown)
+    "Career Development": "Education",
+})
+
+# Author profiles for E-E-A-T compliance
+_AUTHOR_PROFILES = MappingProxyType({
+    "JAMSA - Country's News": {
+        "name": "JAMSA Editorial Team",
+        "title": "Senior News Analysts & Industry Experts",
+        "credentials": [
+            "10+ years of journalism experience",
+            "Specialized in technology, business, and international relations",
+            "Published in leading Indian and international publications",
+            "Regular contributors to industry analysis reports"
+        ],
+        "expertise_areas": [
+            "Technology & Innovation",
+            "Business & Economy", 
+            "International Relations",
+            "Sports Analysis",
+            "Career Development"
+        ],
+        "bio": "Our editorial team combines decades of professional journalism experience with specialized expertise across multiple domains. We prioritize accurate reporting and in-depth analysis backed by verified sources.",
+        "contact": "editorial@countrysnews.com",
+        "social_profiles": [
+            "https://linkedin.com/company/countrys-news",
+            "https://twitter.com/countrys_news"
+        ],
+        "certifications": [
+            "Google News Initiative Certification",
+            "Reuters Institute for the Study of Journalism Alumni",
+            "Society of Professional Journalists Member"
+        ]
+    },
+    "AI News Generator": {
+        "name": "AI-Assisted Editorial Team", 
+        "title": "Technology-Enhanced Content Specialists",
+        "credentials": [
+            "AI-enhanced content creation with human editorial oversight",
+            "Fact-checked and verified by experienced journalists",
+            "Specialized in emerging technology and business trends",
+            "Continuous training on latest industry developments"
+        ],
+        "expertise_areas": [
+            "Artificial Intelligence",
+            "Technology Trends",
+            "Business Innovation",
+            "Data Analysis"
+        ],
+        "bio": "Our AI-assisted editorial process combines advanced language models with human expertise to deliver accurate, timely, and comprehensive news coverage. All AI-generated content undergoes rigorous fact-checking and editorial review.",
+        "contact": "ai-editorial@countrysnews.com",
+        "social_profiles": [
+            "https://linkedin.com/company/countrys-news-tech"
+        ],
+        "certifications": [
+            "AI Ethics in Journalism Certification",
+            "Automated Content Standards Compliance"
+        ]
+    }
+})
+
+_DEFAULT_AUTHOR = "JAMSA - Country's News"
+
+# authorProfile values as written to enhanced articles, built once per author
+_AUTHOR_PROFILE_OUTPUT = {
+    author: {
+        'name': profile['name'],
+        'title': profile['title'],
+        'bio': profile['bio'],
+        'credentials': profile['credentials'],
+        'expertiseAreas': profile['expertise_areas'],
+        'contact': profile['contact'],
+        'socialProfiles': profile['social_profiles'],
+        'certifications': profile['certifications']
+    }
+    for author, profile in _AUTHOR_PROFILES.items()
+}
+
+# Navigation categories that consolidate_category() returns unchanged
+_CANONICAL_CATEGORIES = frozenset({"Business", "Technology", "Sports", "News", "Education"})
+
+# Static E-E-A-T payload shared by every enhanced article. These objects are
+# assigned by reference, so treat them as read-only.
+_EXPERIENCE_TIMEFRAMES = {
+    'technology': '5+ years',
+    'business': '10+ years', 
+    'sports': '8+ years',
+    'politics': '12+ years',
+    'finance': '15+ years'
+}
+
+_EXPERIENCE_LEVEL = 'Expert'
+
+_EXPERIENCE_INTRO_TMPL = "\n\n**Editorial Note**: Our team brings {timeframe} of specialized reporting experience in {category}, having covered hundreds of related stories and maintaining direct industry contacts.\n\n"
+
+_METHODOLOGY_SECTION = """
+### Our Analysis Methodology
+
+Our editorial team employs a rigorous research methodology:
+- **Primary Source Verification**: All claims verified through official documents and direct sources
+- **Cross-Reference Validation**: Information confirmed across multiple independent sources  
+- **Expert Consultation**: Regular consultation with industry professionals and subject matter experts
+- **Data Accuracy**: Statistical information verified through official databases and reports
+- **Temporal Relevance**: All information current as of publication date with regular updates
+
+"""
+
+_AUTHORITY_FOOTER = """
+
+---
+
+**About Country's News**: A trusted source for comprehensive news and analysis, committed to journalistic integrity and accuracy. Our editorial team maintains the highest standards of fact-checking and source verification.
+
+**Editorial Policy**: We adhere to strict editorial guidelines ensuring accuracy, fairness, and transparency in all our reporting. Any corrections or updates are clearly marked and timestamped.
+
+"""
+
+_TRUST_SIGNALS = (
+    'Fact-checked content',
+    'Primary source verification',
+    'Editorial review completed',
+    'Professional journalism standards',
+    'Transparent correction policy'
+)
+
+_EEAT_SCORE = {
+    'experience': 85,
+    'expertise': 90,
+    'authoritativeness': 88,
+    'trustworthiness': 92
+}
+
+_CONTENT_QUALITY = {
+    'originalResearch': True,
+    'factChecked': True,
+    'expertReviewed': True,
+    'sourcesVerified': True,
+    'regularlyUpdated': True,
+    'transparentMethodology': True
+}
+
+_GOOGLE_EAT_COMPLIANCE = {
+    'authorExpertise': 'Verified',
+    'contentAccuracy': 'Fact-checked',
+    'siteAuthority': 'Established',
+    'userTrust': 'High confidence'
+}
+
+# Constant fields added by each enhancement step, applied with a single dict.update
+_EXPERTISE_FIELDS = {
+    'expertiseLevel': 'Professional',
+    'researchMethodology': 'Multi-source verification with expert consultation',
+    'qualityAssurance': 'Peer-reviewed and fact-checked'
+}
+
+_AUTHORITY_FIELDS = {
+    'sourceQuality': 'Primary and authoritative secondary sources',
+    'verificationLevel': 'Independently verified',
+    'editorialStandards': 'Adheres to journalistic ethics and accuracy standards'
+}
+
+_TRUST_FIELDS = {
+    'transparencyNote': 'All sources cited are publicly verifiable. Methodology available upon request.',
+    'editorialTransparency': 'Editorial process includes fact-checking, peer review, and source verification.',
+    'accuracyGuarantee': 'Committed to accuracy - corrections published promptly if errors identified',
+    'sourceTransparency': 'All sources disclosed unless confidentiality required for safety',
+    'trustSignals': _TRUST_SIGNALS,
+    'updatePolicy': 'Article updated as new information becomes available. All updates timestamped and noted.'
+}
+
+_METADATA_FIELDS = {
+    'eeatScore': _EEAT_SCORE,
+    'contentQuality': _CONTENT_QUALITY
+}
 
 class UnifiedEEATSystem:
+    # Substring match, equivalent to testing each keyword against content.lower()
+    _METHODOLOGY_RE = re.compile(r'analysis|data|research|study|report', re.IGNORECASE)
+    _CONCLUSION_RE = re.compile(r'#{2,3} Conclusion')
+
+    # Bound str.format methods for the repeated HTML fragments
+    _CREDENTIAL_LI = '<li>{}</li>'.format
+    _EXPERTISE_BADGE = '<span class="inline-block bg-blue-100 text-blue-800 text-xs px-2 py-1 rounded-full mr-2 mb-1">{}</span>'.format
+    _TRUST_BADGE = '<span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-green-100 text-green-800 mr-2 mb-2"><svg class="w-3 h-3 mr-1" fill="currentColor" viewBox="0 0 20 20"><path fill-rule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zm3.707-9.293a1 1 0 00-1.414-1.414L9 10.586 7.707 9.293a1 1 0 00-1.414 1.414l2 2a1 1 0 001.414 0l4-4z" clip-rule="evenodd"></path></svg>{}</span>'.format
+
     def __init__(self):
         self.output_dir = "dist"
         self.default_category = "News"
+        # Date stamp shared by every article in the batch being enhanced (see enhance_articles_file)
+        self._today = None
         
-        # Category consolidation mapping
-        self.category_mapping = {
-            # Business categories
-            "Business": "Business",
-            "Business & International Relations": "Business", 
-            "Business and Technology": "Business",
-            "Economy": "Business",
-            "Finance": "Business",
-            
-            # Technology categories  
-            "Technology": "Technology",
-            
-            # Sports categories
-            "Sports": "Sports",
-            
-            # News categories
-            "News": "News",
-            "Defence": "News",
-            "Defense": "News",
-            "Environment": "News",
-            "Energy": "News",
-            
-            # Education categories (will be in More dropdown)
-            "Career Development": "Education",
-        }
-        
-        # Author profiles for E-E-A-T compliance
-        self.author_profiles = {
-            "JAMSA - Country's News": {
-                "name": "JAMSA Editorial Team",
-                "title": "Senior News Analysts & Industry Experts",
-                "credentials": [
-                    "10+ years of journalism experience",
-                    "Specialized in technology, business, and international relations",
-                    "Published in leading Indian and international publications",
-                    "Regular contributors to industry analysis reports"
-                ],
-                "expertise_areas": [
-                    "Technology & Innovation",
-                    "Business & Economy", 
-                    "International Relations",
-                    "Sports Analysis",
-                    "Career Development"
-                ],
-                "bio": "Our editorial team combines decades of professional journalism experience with specialized expertise across multiple domains. We prioritize accurate reporting and in-depth analysis backed by verified sources.",
-                "contact": "editorial@countrysnews.com",
-                "social_profiles": [
-                    "https://linkedin.com/company/countrys-news",
-                    "https://twitter.com/countrys_news"
-                ],
-                "certifications": [
-                    "Google News Initiative Certification",
-                    "Reuters Institute for the Study of Journalism Alumni",
-                    "Society of Professional Journalists Member"
-                ]
-            },
-            "AI News Generator": {
-                "name": "AI-Assisted Editorial Team", 
-                "title": "Technology-Enhanced Content Specialists",
-                "credentials": [
-                    "AI-enhanced content creation with human editorial oversight",
-                    "Fact-checked and verified by experienced journalists",
-                    "Specialized in emerging technology and business trends",
-                    "Continuous training on latest industry developments"
-                ],
-                "expertise_areas": [
-                    "Artificial Intelligence",
-                    "Technology Trends",
-                    "Business Innovation",
-                    "Data Analysis"
-                ],
-                "bio": "Our AI-assisted editorial process combines advanced language models with human expertise to deliver accurate, timely, and comprehensive news coverage. All AI-generated content undergoes rigorous fact-checking and editorial review.",
-                "contact": "ai-editorial@countrysnews.com",
-                "social_profiles": [
-                    "https://linkedin.com/company/countrys-news-tech"
-                ],
-                "certifications": [
-                    "AI Ethics in Journalism Certification",
-                    "Automated Content Standards Compliance"
-                ]
-            }
-        }
+        # Shared, read-only lookup tables (module level, built once at import)
+        self.category_mapping = _CATEGORY_MAPPING
+        self.author_profiles = _AUTHOR_PROFILES
 
     # ===== ARTICLE ENHANCEMENT METHODS =====
     
+    def _current_date(self) -> str:
+        """Today's date as YYYY-MM-DD, fixed for the duration of a batch."""
+        return self._today or datetime.now().strftime('%Y-%m-%d')
+
     def consolidate_category(self, original_category: str) -> str:
         """Consolidate categories according to the new navigation strategy."""
         if not original_category:
             return self.default_category
         
+        if original_category in _CANONICAL_CATEGORIES:
+            return original_category
+        
         return self.category_mapping.get(original_category, self.default_category)
     
-    def enhance_article_with_eeat(self, article: Dict[str, Any]) -> Dict[str, Any]:
-        """Enhance a single article with E-E-A-T elements."""
-        enhanced_article = article.copy()
+    def enhance_article_with_eeat(self, article: Dict[str, Any], *, copy: bool = False) -> Dict[str, Any]:
+        """
+        Enhance a single article with E-E-A-T elements.
+        The article is updated in place; pass copy=True to leave the caller's dict untouched.
+        """
+        if copy:
+            article = article.copy()
         
         # Consolidate category first
-        if 'category' in enhanced_article:
-            original_category = enhanced_article['category']
-            consolidated_category = self.consolidate_category(original_category)
-            if original_category != consolidated_category:
-                enhanced_article['category'] = consolidated_category
+        if 'category' in article:
+            article['category'] = self.consolidate_category(article['category'])
         
         # Add all E-E-A-T enhancements
-        enhanced_article = self._add_author_profile(enhanced_article)
-        enhanced_article = self._add_experience_signals(enhanced_article)
-        enhanced_article = self._add_expertise_indicators(enhanced_article)
-        enhanced_article = self._add_authority_markers(enhanced_article)
-        enhanced_article = self._add_trust_elements(enhanced_article)
-        enhanced_article = self._add_eeat_metadata(enhanced_article)
-        enhanced_article = self._update_structured_data_eeat(enhanced_article)
+        self._add_author_profile(article)
+        self._add_experience_signals(article)
+        self._add_expertise_indicators(article)
+        self._add_authority_markers(article)
+        self._add_trust_elements(article)
+        self._add_eeat_metadata(article)
+        self._update_structured_data_eeat(article)
         
-        return enhanced_article
+        return article
 
-    def _add_author_profile(self, article: Dict[str, Any]) -> Dict[str, Any]:
+    def _add_author_profile(self, article: Dict[str, Any]) -> None:
         """Add comprehensive author profile information."""
-        author_name = article.get('author', 'JAMSA - Country\'s News')
-        profile = self.author_profiles.get(author_name, self.author_profiles['JAMSA - Country\'s News'])
-        
-        article['authorProfile'] = {
-            'name': profile['name'],
-            'title': profile['title'],
-            'bio': profile['bio'],
-            'credentials': profile['credentials'],
-            'expertiseAreas': profile['expertise_areas'],
-            'contact': profile['contact'],
-            'socialProfiles': profile['social_profiles'],
-            'certifications': profile['certifications']
-        }
+        author_name = article.get('author', _DEFAULT_AUTHOR)
+        profile = _AUTHOR_PROFILE_OUTPUT.get(author_name, _AUTHOR_PROFILE_OUTPUT[_DEFAULT_AUTHOR])
         
+        # Shared by every article from the same author; treat as read-only
+        article['authorProfile'] = profile
         article['author'] = profile['name']
-        return article
 
-    def _add_experience_signals(self, article: Dict[str, Any]) -> Dict[str, Any]:
+    def _add_experience_signals(self, article: Dict[str, Any]) -> None:
         """Add first-hand experience indicators to content."""
         category = article.get('category', '').lower()
         content = article.get('content', '')
         
-        timeframes = {
-            'technology': '5+ years',
-            'business': '10+ years', 
-            'sports': '8+ years',
-            'politics': '12+ years',
-            'finance': '15+ years'
-        }
-        
-        timeframe = timeframes.get(category, '7+ years')
-        experience_intro = f"\n\n**Editorial Note**: Our team brings {timeframe} of specialized reporting experience in {article.get('category', 'this sector')}, having covered hundreds of related stories and maintaining direct industry contacts.\n\n"
+        timeframe = _EXPERIENCE_TIMEFRAMES.get(category, '7+ years')
+        experience_intro = _EXPERIENCE_INTRO_TMPL.format_map({
+            'timeframe': timeframe,
+            'category': article.get('category', 'this sector')
+        })
         
-        paragraphs = content.split('\n\n')
-        if len(paragraphs) > 1:
-            paragraphs.insert(1, experience_intro)
-            article['content'] = '\n\n'.join(paragraphs)
+        # Insert the note after the first paragraph (same result as split/insert/join on '\n\n')
+        first_break = content.find('\n\n')
+        if first_break >= 0:
+            article['content'] = content[:first_break + 2] + experience_intro + '\n\n' + content[first_break + 2:]
         
-        article['experienceLevel'] = 'Expert'
+        article['experienceLevel'] = _EXPERIENCE_LEVEL
         article['reportingExperience'] = timeframe
         article['coverageHistory'] = f"Part of our ongoing coverage of {article.get('category', 'industry news')}"
-        
-        return article
 
-    def _add_expertise_indicators(self, article: Dict[str, Any]) -> Dict[str, Any]:
+    def _add_expertise_indicators(self, article: Dict[str, Any]) -> None:
         """Add expertise demonstrations throughout the content."""
         content = article.get('content', '')
         
-        if any(keyword in content.lower() for keyword in ['analysis', 'data', 'research', 'study', 'report']):
-            methodology_section = """
-### Our Analysis Methodology
-
-Our editorial team employs a rigorous research methodology:
-- **Primary Source Verification**: All claims verified through official documents and direct sources
-- **Cross-Reference Validation**: Information confirmed across multiple independent sources  
-- **Expert Consultation**: Regular consultation with industry professionals and subject matter experts
-- **Data Accuracy**: Statistical information verified through official databases and reports
-- **Temporal Relevance**: All information current as of publication date with regular updates
-
-"""
-            if '### Conclusion' in content or '## Conclusion' in content:
-                content = content.replace('### Conclusion', methodology_section + '### Conclusion')
-                content = content.replace('## Conclusion', methodology_section + '## Conclusion')
+        if self._METHODOLOGY_RE.search(content):
+            conclusion = self._CONCLUSION_RE.search(content)
+            if conclusion:
+                content = content[:conclusion.start()] + _METHODOLOGY_SECTION + content[conclusion.start():]
             else:
-                content += methodology_section
+                content += _METHODOLOGY_SECTION
                 
             article['content'] = content
         
-        article['expertiseLevel'] = 'Professional'
-        article['researchMethodology'] = 'Multi-source verification with expert consultation'
-        article['qualityAssurance'] = 'Peer-reviewed and fact-checked'
-        
-        return article
+        article.update(_EXPERTISE_FIELDS)
 
-    def _add_authority_markers(self, article: Dict[str, Any]) -> Dict[str, Any]:
+    def _add_authority_markers(self, article: Dict[str, Any]) -> None:
         """Add authoritativeness signals and source credibility."""
-        article['sourceQuality'] = 'Primary and authoritative secondary sources'
-        article['verificationLevel'] = 'Independently verified'
-        article['editorialStandards'] = 'Adheres to journalistic ethics and accuracy standards'
+        article.update(_AUTHORITY_FIELDS)
         
-        authority_footer = """
+        article['content'] += _AUTHORITY_FOOTER
 
----
-
-**About Country's News**: A trusted source for comprehensive news and analysis, committed to journalistic integrity and accuracy. Our editorial team maintains the highest standards of fact-checking and source verification.
-
-**Editorial Policy**: We adhere to strict editorial guidelines ensuring accuracy, fairness, and transparency in all our reporting. Any corrections or updates are clearly marked and timestamped.
-
-"""
-        article['content'] += authority_footer
-        return article
-
-    def _add_trust_elements(self, article: Dict[str, Any]) -> Dict[str, Any]:
+    def _add_trust_elements(self, article: Dict[str, Any]) -> None:
         """Add trustworthiness indicators and transparency elements."""
-        current_date = datetime.now().strftime('%Y-%m-%d')
-        
-        article['transparencyNote'] = 'All sources cited are publicly verifiable. Methodology available upon request.'
-        article['editorialTransparency'] = 'Editorial process includes fact-checking, peer review, and source verification.'
-        article['lastFactCheck'] = current_date
-        article['accuracyGuarantee'] = 'Committed to accuracy - corrections published promptly if errors identified'
-        article['sourceTransparency'] = 'All sources disclosed unless confidentiality required for safety'
-        
-        article['trustSignals'] = [
-            'Fact-checked content',
-            'Primary source verification',
-            'Editorial review completed',
-            'Professional journalism standards',
-            'Transparent correction policy'
-        ]
-        
-        article['updatePolicy'] = 'Article updated as new information becomes available. All updates timestamped and noted.'
-        return article
+        article.update(_TRUST_FIELDS)
+        article['lastFactCheck'] = self._current_date()
 
-    def _add_eeat_metadata(self, article: Dict[str, Any]) -> Dict[str, Any]:
+    def _add_eeat_metadata(self, article: Dict[str, Any]) -> None:
         """Add comprehensive E-E-A-T metadata."""
-        article['eeatScore'] = {
-            'experience': 85,
-            'expertise': 90,
-            'authoritativeness': 88,
-            'trustworthiness': 92
-        }
-        
-        article['contentQuality'] = {
-            'originalResearch': True,
-            'factChecked': True,
-            'expertReviewed': True,
-            'sourcesVerified': True,
-            'regularlyUpdated': True,
-            'transparentMethodology': True
-        }
-        
-        article['googleEATCompliance'] = {
-            'authorExpertise': 'Verified',
-            'contentAccuracy': 'Fact-checked',
-            'siteAuthority': 'Established',
-            'userTrust': 'High confidence',
-            'lastReviewed': datetime.now().strftime('%Y-%m-%d')
-        }
-        
-        return article
+        article.update(_METADATA_FIELDS)
+        article['googleEATCompliance'] = dict(_GOOGLE_EAT_COMPLIANCE,
+                                              lastReviewed=self._current_date())
 
-    def _update_structured_data_eeat(self, article: Dict[str, Any]) -> Dict[str, Any]:
-        """Update structured data with E-E-A-T elements."""
+    def _update_structured_data_eeat(self, article: Dict[str, Any]) -> None:
+        """
+        Update structured data with E-E-A-T elements.
+        A JSON string is parsed and re-serialized; a dict supplied by upstream code is updated
+        in place and left as a dict for the final file write.
+        """
+        raw_structured_data = article.get('structuredData', '{}')
         try:
-            structured_data = json.loads(article.get('structuredData', '{}'))
+            if isinstance(raw_structured_data, dict):
+                structured_data = raw_structured_data
+            else:
+                structured_data = _json_loads(raw_structured_data)
             
             if structured_data:
                 # Handle author data (list or dict)
@@ -332,12 +488,11 @@ Our editorial team employs a rigorous research methodology:
                     'editorialStandards': 'Professional journalism standards'
                 })
                 
-            article['structuredData'] = json.dumps(structured_data, indent=2)
+            if structured_data is not raw_structured_data:
+                article['structuredData'] = _json_dumps(structured_data)
             
         except json.JSONDecodeError:
             print(f"Warning: Could not parse structured data for article {article.get('id', 'unknown')}")
-        
-        return article
 
     # ===== HTML GENERATION METHODS =====
     
@@ -347,18 +502,29 @@ Our editorial team employs a rigorous research methodology:
         if not author_profile:
             return ""
         
+        return self._render_author_box(
+            author_profile.get('name', 'Author')[0],
+            author_profile.get('name', 'Editorial Team'),
+            author_profile.get('title', 'Senior Editor'),
+            author_profile.get('bio', 'Experienced journalist and industry expert.'),
+            tuple(author_profile.get('credentials') or ())[:3],
+            tuple(author_profile.get('expertiseAreas') or ())[:4]
+        )
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _render_author_box(cls, initial: str, name: str, title: str, bio: str,
+                           credentials: tuple, expertise_areas: tuple) -> str:
+        """Render the author box; cached because most articles share a handful of authors."""
         credentials_html = ""
-        if author_profile.get('credentials'):
-            credentials_html = "<ul class='list-disc list-inside text-sm text-gray-600 mt-2'>"
-            for credential in author_profile['credentials'][:3]:
-                credentials_html += f"<li>{credential}</li>"
-            credentials_html += "</ul>"
+        if credentials:
+            credentials_html = ("<ul class='list-disc list-inside text-sm text-gray-600 mt-2'>"
+                                + ''.join(map(cls._CREDENTIAL_LI, credentials))
+                                + "</ul>")
         
         expertise_html = ""
-        if author_profile.get('expertiseAreas'):
-            expertise_badges = ""
-            for area in author_profile['expertiseAreas'][:4]:
-                expertise_badges += f'<span class="inline-block bg-blue-100 text-blue-800 text-xs px-2 py-1 rounded-full mr-2 mb-1">{area}</span>'
+        if expertise_areas:
+            expertise_badges = ''.join(map(cls._EXPERTISE_BADGE, expertise_areas))
             expertise_html = f'<div class="mt-3"><h5 class="text-sm font-semibold text-gray-700 mb-1">Expertise Areas:</h5><div>{expertise_badges}</div></div>'
         
         return f"""
@@ -366,16 +532,16 @@ Our editorial team employs a rigorous research methodology:
             <div class="flex items-start space-x-4">
                 <div class="flex-shrink-0">
                     <div class="w-16 h-16 bg-blue-600 rounded-full flex items-center justify-center text-white font-bold text-xl">
-                        {author_profile.get('name', 'Author')[0]}
+                        {initial}
                     </div>
                 </div>
                 <div class="flex-grow">
                     <div class="flex items-center space-x-2 mb-2">
-                        <h4 class="text-lg font-bold text-gray-900">{author_profile.get('name', 'Editorial Team')}</h4>
+                        <h4 class="text-lg font-bold text-gray-900">{name}</h4>
                         <span class="bg-green-100 text-green-800 text-xs px-2 py-1 rounded-full">✓ Verified Expert</span>
                     </div>
-                    <p class="text-sm font-medium text-blue-700 mb-2">{author_profile.get('title', 'Senior Editor')}</p>
-                    <p class="text-gray-700 text-sm mb-3">{author_profile.get('bio', 'Experienced journalist and industry expert.')}</p>
+                    <p class="text-sm font-medium text-blue-700 mb-2">{title}</p>
+                    <p class="text-gray-700 text-sm mb-3">{bio}</p>
                     {credentials_html}
                     {expertise_html}
                 </div>
@@ -385,7 +551,7 @@ Our editorial team employs a rigorous research methodology:
 
     def generate_eeat_trust_indicators(self, article: Dict[str, Any]) -> str:
         """Generate HTML for trust and credibility indicators."""
-        fact_check_date = article.get('lastFactCheck', datetime.now().strftime('%Y-%m-%d'))
+        fact_check_date = article.get('lastFactCheck') or self._current_date()
         
         trust_badges = []
         if article.get('factCheckedBy'):
@@ -397,9 +563,13 @@ Our editorial team employs a rigorous research methodology:
         if article.get('expertiseLevel') == 'Professional':
             trust_badges.append('Expert Analysis')
         
-        badges_html = ""
-        for badge in trust_badges:
-            badges_html += f'<span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-green-100 text-green-800 mr-2 mb-2"><svg class="w-3 h-3 mr-1" fill="currentColor" viewBox="0 0 20 20"><path fill-rule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zm3.707-9.293a1 1 0 00-1.414-1.414L9 10.586 7.707 9.293a1 1 0 00-1.414 1.414l2 2a1 1 0 001.414 0l4-4z" clip-rule="evenodd"></path></svg>{badge}</span>'
+        return self._render_trust_indicators(fact_check_date, tuple(trust_badges))
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _render_trust_indicators(cls, fact_check_date: str, trust_badges: tuple) -> str:
+        """Render the trust indicator box; cached because it only varies by date and badge set."""
+        badges_html = ''.join(map(cls._TRUST_BADGE, trust_badges))
         
         return f"""
         <div class="bg-gray-50 border border-gray-200 rounded-lg p-4 my-6">
@@ -422,39 +592,82 @@ Our editorial team employs a rigorous research methodology:
 
     # ===== FILE PROCESSING METHODS =====
     
-    def enhance_articles_file(self, input_file: str, output_file: str = None) -> str:
-        """Enhance all articles in a JSON file with E-E-A-T elements."""
+    def _enhance_article_safely(self, article: Dict[str, Any], copy: bool = False):
+        """Enhance one article, returning (enhanced_article, None) or (None, error)."""
+        try:
+            return self.enhance_article_with_eeat(article, copy=copy), None
+        except Exception as e:
+            return None, str(e)
+
+    def _enhance_article_stream(self, articles: Iterable[Dict[str, Any]], workers: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield enhanced articles in input order, falling back to the original article on error.
+        With workers > 1, articles go to a process pool in STREAM_BATCH_SIZE batches; the next
+        batch is submitted before the previous one is yielded, so at most two are in flight.
+        """
+        def results():
+            if workers <= 1:
+                for article in articles:
+                    # Copy so a failed article can still fall back to its original content
+                    yield article, self._enhance_article_safely(article, copy=True)
+                return
+            
+            chunksize = max(1, STREAM_BATCH_SIZE // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_enhance_worker,
+                                     initargs=(self._today,)) as executor:
+                pending = None
+                while True:
+                    batch = list(islice(articles, STREAM_BATCH_SIZE))
+                    if not batch:
+                        break
+                    submitted = (batch, executor.map(_enhance_article_worker, batch, chunksize=chunksize))
+                    if pending:
+                        yield from zip(*pending)
+                    pending = submitted
+                if pending:
+                    yield from zip(*pending)
+        
+        if tqdm is not None:
+            progress = tqdm(results(), desc='E-E-A-T', unit='article')
+            log = tqdm.write
+        else:
+            progress = results()
+            log = print
+        
+        for i, (article, (enhanced_article, error)) in enumerate(progress):
+            if error is not None:
+                log(f"   ⚠️  Error enhancing article {article.get('id', i)}: {error}")
+                enhanced_article = article
+            
+            if tqdm is None and (i + 1) % 10 == 0:
+                print(f"   Enhanced {i + 1} articles...")
+            
+            yield enhanced_article
+
+    def enhance_articles_file(self, input_file: str, output_file: str = None, workers: int = 1) -> str:
+        """
+        Enhance all articles in a JSON file with E-E-A-T elements.
+        Runs in-process by default (each article takes well under a millisecond, so pool
+        overhead outweighs the work); pass workers > 1 to use a process pool.
+        """
         if output_file is None:
             output_file = input_file.replace('.json', '_eeat_enhanced.json')
         
-        print(f"📚 Loading articles from {input_file}...")
-        with open(input_file, 'r', encoding='utf-8') as f:
-            articles = json.load(f)
+        print(f"📚 Streaming articles from {input_file}...")
+        articles = _iter_json_array(input_file)
         
-        print(f"🔧 Enhancing {len(articles)} articles with E-E-A-T elements...")
-        enhanced_articles = []
-        
-        for i, article in enumerate(articles):
-            try:
-                enhanced_article = self.enhance_article_with_eeat(article)
-                enhanced_articles.append(enhanced_article)
-                
-                if (i + 1) % 10 == 0:
-                    print(f"   Enhanced {i + 1}/{len(articles)} articles...")
-                    
-            except Exception as e:
-                print(f"   ⚠️  Error enhancing article {article.get('id', i)}: {str(e)}")
-                enhanced_articles.append(article)
-        
-        print(f"💾 Saving enhanced articles to {output_file}...")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(enhanced_articles, f, indent=2, ensure_ascii=False)
+        print(f"🔧 Enhancing articles with E-E-A-T elements, saving to {output_file}...")
+        self._today = datetime.now().strftime('%Y-%m-%d')
+        try:
+            article_count = _write_json_array(self._enhance_article_stream(articles, workers), output_file)
+        finally:
+            self._today = None
         
-        print(f"✅ Successfully enhanced {len(enhanced_articles)} articles with E-E-A-T elements!")
+        print(f"✅ Successfully enhanced {article_count} articles with E-E-A-T elements!")
         
         # Generate report
         report_file = output_file.replace('.json', '_report.txt')
-        self._generate_enhancement_report(enhanced_articles, report_file)
+        self._generate_enhancement_report(article_count, report_file)
         
         return output_file
 
@@ -462,46 +675,29 @@ Our editorial team employs a rigorous research methodology:
         """Generate complete website with E-E-A-T enhanced articles."""
         print(f"🌐 Generating E-E-A-T enhanced website from {articles_file}...")
         
-        # This would integrate with your existing generateSite.py logic
-        # For now, we'll just call the existing script with the enhanced articles
-        import subprocess
-        
-        # Backup current generateSite.py data file setting
-        with open('generateSite.py', 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Temporarily update to use enhanced articles
-        updated_content = content.replace(
-            'ARTICLES_DATA_FILE = "perplexityArticles.json"',
-            f'ARTICLES_DATA_FILE = "{articles_file}"'
-        )
-        
-        with open('generateSite.py', 'w', encoding='utf-8') as f:
-            f.write(updated_content)
-        
+        # Run generateSite.py in-process against the enhanced articles file; import errors
+        # (e.g. a missing site dependency) are reported like any other build failure
         try:
-            # Run the site generation
-            result = subprocess.run(['python3', 'generateSite.py'], 
-                                  capture_output=True, text=True, cwd='.')
-            if result.returncode == 0:
-                print("✅ Website generated successfully with E-E-A-T enhancements!")
-                print(result.stdout)
-            else:
-                print("❌ Error generating website:")
-                print(result.stderr)
-        finally:
-            # Restore original generateSite.py
-            with open('generateSite.py', 'w', encoding='utf-8') as f:
-                f.write(content)
-
-    def _generate_enhancement_report(self, articles: List[Dict[str, Any]], report_file: str):
+            import generateSite
+            built = generateSite.main(articles_file)
+        except Exception as e:
+            print("❌ Error generating website:")
+            print(e)
+            return
+        
+        if built:
+            print("✅ Website generated successfully with E-E-A-T enhancements!")
+        else:
+            print("❌ Error generating website: could not load articles")
+
+    def _generate_enhancement_report(self, article_count: int, report_file: str):
         """Generate a comprehensive E-E-A-T enhancement report."""
         report = f"""
 E-E-A-T Enhancement Report - Unified System
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 OVERVIEW:
-- Total articles enhanced: {len(articles)}
+- Total articles enhanced: {article_count}
 - Enhancement method: Google E-E-A-T 2024-2025 Guidelines
 - System: Unified E-E-A-T Consolidation Script
 
@@ -548,8 +744,7 @@ NEXT STEPS:
 ✅ Your content now fully complies with Google's 2024-2025 E-E-A-T standards!
 """
         
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report)
+        _write_text_atomic(report, report_file)
         
         print(f"📊 Enhancement report saved to {report_file}")
 
@@ -569,7 +764,24 @@ NEXT STEPS:
         print("✅ Website generated with trust indicators")
         print("🎯 Your site now meets Google's latest E-E-A-T guidelines!")
 
+_worker_system = None
+
+def _init_enhance_worker(today: str):
+    """ProcessPoolExecutor initializer; builds the worker's UnifiedEEATSystem with the batch date."""
+    global _worker_system
+    _worker_system = UnifiedEEATSystem()
+    _worker_system._today = today
+
+def _enhance_article_worker(article: Dict[str, Any]):
+    """
+    ProcessPoolExecutor entry point, run against the system built by _init_enhance_worker.
+    Workers get a pickled copy of each article, so it is enhanced in place.
+    """
+    return _worker_system._enhance_article_safely(article)
+
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Unified E-E-A-T Article Generation System')
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -577,6 +789,7 @@ def main():
     enhance_parser = subparsers.add_parser('enhance', help='Enhance articles with E-E-A-T elements')
     enhance_parser.add_argument('--input', '-i', required=True, help='Input JSON file containing articles')
     enhance_parser.add_argument('--output', '-o', help='Output file (default: input_file_eeat_enhanced.json)')
+    enhance_parser.add_argument('--workers', '-w', type=int, default=1, help='Worker processes for enhancement (default: 1, in-process)')
     
     # Generate command  
     generate_parser = subparsers.add_parser('generate', help='Generate website with E-E-A-T enhanced articles')
@@ -595,7 +808,7 @@ def main():
     system = UnifiedEEATSystem()
     
     if args.command == 'enhance':
-        system.enhance_articles_file(args.input, args.output)
+        system.enhance_articles_file(args.input, args.output, args.workers)
     elif args.command == 'generate':
         system.generate_eeat_website(args.articles)
     elif args.command == 'full-process':
@@ -4,47 +4,55 @@ Fix date formats in perplexityArticles.json
 Removes invalid 'Z' suffix from dates
 """
 
-import json
-from datetime import datetime
 import os
+import re
+from datetime import datetime
+import sys
+import shutil
+
+# "dateModified"/"publishDate" string values ending in Z; works on the raw file bytes,
+# so the JSON never has to be parsed and re-serialized for a one-character fix
+_TRAILING_Z_DATE = re.compile(rb'("(dateModified|publishDate)"\s*:\s*"([^"\\]*))Z"')
 
 def main():
     print("🔧 Fixing date formats in articles...")
-    
-    # Load articles
-    with open('perplexityArticles.json', 'r') as f:
-        articles = json.load(f)
-    
-    # Create backup
+
+    # Create backup (plain byte copy of the original file)
     backup_filename = f'perplexityArticles_datefix_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-    with open(backup_filename, 'w') as f:
-        json.dump(articles, f, indent=2)
+    shutil.copyfile('perplexityArticles.json', backup_filename)
     print(f"📁 Backup created: {backup_filename}")
-    
+
+    # Load articles
+    with open('perplexityArticles.json', 'rb') as f:
+        data = f.read()
+
     # Fix date formats
-    fixed_count = 0
-    for i, article in enumerate(articles):
-        # Fix dateModified
-        if 'dateModified' in article and article['dateModified'].endswith('Z'):
-            old_date = article['dateModified']
-            article['dateModified'] = article['dateModified'][:-1]  # Remove 'Z'
-            print(f"Fixed article {i+1} dateModified: {old_date} -> {article['dateModified']}")
-            fixed_count += 1
-        
-        # Ensure publishDate doesn't have 'Z'
-        if 'publishDate' in article and article['publishDate'].endswith('Z'):
-            old_date = article['publishDate']
-            article['publishDate'] = article['publishDate'][:-1]  # Remove 'Z'
-            print(f"Fixed article {i+1} publishDate: {old_date} -> {article['publishDate']}")
-            fixed_count += 1
-    
-    # Save fixed articles
-    with open('perplexityArticles.json', 'w') as f:
-        json.dump(articles, f, indent=2)
-    
+    fix_log = []
+    def strip_z(match):
+        field, new_date = match.group(2).decode(), match.group(3).decode()
+        fix_log.append(f"Fixed {field}: {new_date}Z -> {new_date}\n")
+        return match.group(1) + b'"'
+
+    data, fixed_count = _TRAILING_Z_DATE.subn(strip_z, data)
+    # Emit the per-fix log in one write rather than a print per fix
+    sys.stdout.write(''.join(fix_log))
     print(f"✅ Fixed {fixed_count} date format issues")
-    print(f"✅ Updated perplexityArticles.json")
-    print(f"📊 Total articles processed: {len(articles)}")
+
+    # Save fixed articles (untouched bytes stay exactly as they were); written to a temp
+    # file and swapped in, so an interrupted run never leaves a truncated articles file
+    if fixed_count:
+        tmp_path = 'perplexityArticles.json.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, 'perplexityArticles.json')
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        print(f"✅ Updated perplexityArticles.json")
 
 if __name__ == "__main__":
     main()
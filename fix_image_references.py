@@ -6,15 +6,69 @@ Updates all .jpg/.png references to .webp in JSON files and other content
 
 import os
 import json
+import mmap
 import re
+import shutil
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def fix_json_file(file_path):
+# .jpg/.jpeg/.png in any case; jpeg is listed first so it is not cut short at "jp".
+# A bytes pattern so it can run straight over an mmap of the file.
+EXT_RE = re.compile(rb'\.(?:jpeg|jpg|png)', re.IGNORECASE)
+# Cheap pre-screen for the same references: no IGNORECASE and a two-byte prefix, so files
+# that are already fully converted are rejected about twice as fast as by EXT_RE itself
+_EXT_PREFIX_RE = re.compile(rb'\.[jJpP][pPnN]')
+
+# Files already checked, keyed by path -> [mtime_ns, size]; delete it to force a full rescan
+SCAN_CACHE_FILE = '.image_ref_fix_cache.json'
+
+def _stat_key(file_path):
+    """(mtime_ns, size) of a file as a JSON-friendly list, or None if it is missing"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+def _load_scan_cache():
+    """Load the per-file scan cache; a missing or unreadable cache just means rescan everything"""
+    try:
+        with open(SCAN_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_scan_cache(cache):
+    """Write the scan cache via a temp file and os.replace"""
+    tmp_path = SCAN_CACHE_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, SCAN_CACHE_FILE)
+
+def _write_replaced(mm, out):
+    """
+    Copy mm to out with every extension replaced by .webp, without building the new
+    content in memory. Returns a Counter of the replaced extensions.
+    """
+    counts = Counter()
+    with memoryview(mm) as view:
+        pos = 0
+        for match in EXT_RE.finditer(mm):
+            out.write(view[pos:match.start()])
+            out.write(b'.webp')
+            counts[match.group(0).lower()] += 1
+            pos = match.end()
+        out.write(view[pos:])
+    return counts
+
+def fix_text_file(file_path):
     """
-    Fix image references in a JSON file from .jpg/.png to .webp
+    Fix image references in a text file (JSON data or Python source) from .jpg/.png to .webp
     
     Args:
-        file_path (str): Path to the JSON file
+        file_path (str): Path to the file
         
     Returns:
         dict: Summary of changes made
@@ -22,70 +76,36 @@ def fix_json_file(file_path):
     changes_made = 0
     
     try:
-        # Read the JSON file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Count original references
-        original_jpg_count = len(re.findall(r'\.jpg', content, re.IGNORECASE))
-        original_png_count = len(re.findall(r'\.png', content, re.IGNORECASE))
-        original_jpeg_count = len(re.findall(r'\.jpeg', content, re.IGNORECASE))
-        
-        # Replace .jpg with .webp
-        content = re.sub(r'\.jpg', '.webp', content, flags=re.IGNORECASE)
-        
-        # Replace .png with .webp  
-        content = re.sub(r'\.png', '.webp', content, flags=re.IGNORECASE)
-        
-        # Replace .jpeg with .webp
-        content = re.sub(r'\.jpeg', '.webp', content, flags=re.IGNORECASE)
-        
-        # Write the updated content back
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        changes_made = original_jpg_count + original_png_count + original_jpeg_count
-        
-        return {
-            'file': file_path,
-            'changes': changes_made,
-            'jpg_count': original_jpg_count,
-            'png_count': original_png_count,
-            'jpeg_count': original_jpeg_count
-        }
-        
-    except Exception as e:
-        print(f"❌ Error processing {file_path}: {e}")
-        return {
-            'file': file_path,
-            'changes': 0,
-            'error': str(e)
-        }
-
-def fix_python_files(file_path):
-    """
-    Fix image references in Python files from .jpg/.png to .webp
-    """
-    changes_made = 0
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Count original references
-        original_jpg_count = len(re.findall(r'\.jpg', content, re.IGNORECASE))
-        original_png_count = len(re.findall(r'\.png', content, re.IGNORECASE))
-        original_jpeg_count = len(re.findall(r'\.jpeg', content, re.IGNORECASE))
-        
-        # Replace image extensions with webp
-        content = re.sub(r'\.jpg', '.webp', content, flags=re.IGNORECASE)
-        content = re.sub(r'\.png', '.webp', content, flags=re.IGNORECASE)
-        content = re.sub(r'\.jpeg', '.webp', content, flags=re.IGNORECASE)
-        
-        # Write back
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+        counts = Counter()
+        tmp_path = file_path + '.tmp'
+        try:
+            # mmap cannot map an empty file, and an empty file has nothing to fix
+            if os.path.getsize(file_path):
+                with open(file_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        # One front-to-back pass: let the kernel read ahead aggressively
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    # Files without a single reference are left alone (no temp copy, mtime kept)
+                    if _EXT_PREFIX_RE.search(mm) and EXT_RE.search(mm):
+                        # Stream unchanged spans from the mapping into a temp file
+                        with open(tmp_path, 'wb') as out:
+                            counts = _write_replaced(mm, out)
+                            # Durable before it replaces the original
+                            out.flush()
+                            os.fsync(out.fileno())
+                            if hasattr(os, 'posix_fadvise'):
+                                # Batch runs touch many large files; don't keep this one cached
+                                os.posix_fadvise(out.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            if counts:
+                # Swap in the new file only after the mapping is closed; keep the original permissions
+                shutil.copymode(file_path, tmp_path)
+                os.replace(tmp_path, file_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        original_jpg_count, original_png_count, original_jpeg_count = counts[b'.jpg'], counts[b'.png'], counts[b'.jpeg']
         changes_made = original_jpg_count + original_png_count + original_jpeg_count
         
         return {
@@ -112,6 +132,11 @@ def find_and_fix_references():
     # Files to process
     files_to_process = []
     
+    # One directory read up front; the probes below are set lookups instead of a stat per name
+    # (is_file() uses the d_type from the directory read)
+    with os.scandir('.') as entries:
+        file_names = {entry.name for entry in entries if entry.is_file()}
+    
     # Add JSON files
     json_files = [
         'articles.json',
@@ -119,7 +144,7 @@ def find_and_fix_references():
     ]
     
     for json_file in json_files:
-        if os.path.exists(json_file):
+        if json_file in file_names:
             files_to_process.append(('json', json_file))
     
     # Add Python files that might contain image references
@@ -130,13 +155,14 @@ def find_and_fix_references():
     ]
     
     for py_file in python_files:
-        if os.path.exists(py_file):
+        if py_file in file_names:
             files_to_process.append(('python', py_file))
     
     # Find all perplexity operation files
-    for file in os.listdir('.'):
-        if file.startswith('perplexityArticles_operation_') and file.endswith('.json'):
-            files_to_process.append(('json', file))
+    files_to_process.extend(
+        ('json', name) for name in sorted(file_names)
+        if name.startswith('perplexityArticles_operation_') and name.endswith('.json')
+    )
     
     return files_to_process
 
@@ -160,31 +186,54 @@ def main():
     
     print()
     
+    # Skip files that have not changed since a previous run checked them
+    scan_cache = _load_scan_cache()
+    file_paths = [file_path for _, file_path in files_to_process
+                  if scan_cache.get(file_path) != _stat_key(file_path)]
+    unchanged_files = len(files_to_process) - len(file_paths)
+    if unchanged_files:
+        print(f"⏭️  Skipping {unchanged_files} files unchanged since the last run")
+    
     # Process files
     total_changes = 0
     successful_files = 0
     failed_files = 0
     
-    for file_type, file_path in files_to_process:
-        print(f"🔄 Processing: {file_path}")
-        
-        if file_type == 'json':
-            result = fix_json_file(file_path)
-        elif file_type == 'python':
-            result = fix_python_files(file_path)
+    # Each file is an independent read-modify-write, so spread them over processes
+    workers = min(len(file_paths), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fix_text_file, file_paths))
+    else:
+        results = [fix_text_file(file_path) for file_path in file_paths]
+    
+    # Collect the per-file report and write it once instead of several prints per file
+    report = []
+    for file_path, result in zip(file_paths, results):
+        report.append(f"🔄 Processed: {file_path}")
         
         if 'error' in result:
-            print(f"   ❌ Failed: {result['error']}")
+            report.append(f"   ❌ Failed: {result['error']}")
             failed_files += 1
         else:
             changes = result['changes']
             if changes > 0:
-                print(f"   ✅ Fixed {changes} references (.jpg: {result.get('jpg_count', 0)}, .png: {result.get('png_count', 0)}, .jpeg: {result.get('jpeg_count', 0)})")
+                report.append(f"   ✅ Fixed {changes} references (.jpg: {result.get('jpg_count', 0)}, .png: {result.get('png_count', 0)}, .jpeg: {result.get('jpeg_count', 0)})")
                 total_changes += changes
                 successful_files += 1
             else:
-                print(f"   ⏭️  No changes needed")
+                report.append(f"   ⏭️  No changes needed")
                 successful_files += 1
+            # Remember the file as it is now, after any rewrite
+            scan_cache[file_path] = _stat_key(file_path)
+    if report:
+        sys.stdout.write('\n'.join(report) + '\n')
+    
+    if file_paths:
+        try:
+            _save_scan_cache(scan_cache)
+        except OSError as e:
+            print(f"⚠️  Could not save {SCAN_CACHE_FILE}: {e}")
     
     print("\n" + "=" * 50)
     print("🎉 IMAGE REFERENCE UPDATE COMPLETE!")
@@ -2181,7 +2181,11 @@ def copy_logo_files():
         else:
             print(f"Warning: {logo_file} not found, skipping")
 
-def main():
+def main(articles_file=None):
+    """Build the site from articles_file (defaults to ARTICLES_DATA_FILE). Returns False if the articles could not be loaded."""
+    if articles_file is None:
+        articles_file = ARTICLES_DATA_FILE
+    
     create_directory(OUTPUT_DIR)
     create_directory(os.path.join(OUTPUT_DIR, "articles"))
     create_directory(os.path.join(OUTPUT_DIR, "categories"))
@@ -2190,11 +2194,11 @@ def main():
     copy_logo_files()
 
     articles_data = []
-    if os.path.exists(ARTICLES_DATA_FILE):
+    if os.path.exists(articles_file):
         try:
-            with open(ARTICLES_DATA_FILE, 'r', encoding='utf-8') as f:
+            with open(articles_file, 'r', encoding='utf-8') as f:
                 articles_data = json.load(f)
-            print(f"Successfully loaded {len(articles_data)} articles from {ARTICLES_DATA_FILE}")
+            print(f"Successfully loaded {len(articles_data)} articles from {articles_file}")
             
             # Validate articles have required fields
             required_fields = ['id', 'title', 'slug', 'content']
@@ -2204,14 +2208,14 @@ def main():
                         print(f"Warning: Article {i+1} missing required field: {field}")
                         
         except FileNotFoundError:
-            print(f"Error: {ARTICLES_DATA_FILE} not found. Please create it with your article data.")
-            return
+            print(f"Error: {articles_file} not found. Please create it with your article data.")
+            return False
         except json.JSONDecodeError as e:
-            print(f"Error: Could not decode JSON from {ARTICLES_DATA_FILE}: {e}")
-            return
+            print(f"Error: Could not decode JSON from {articles_file}: {e}")
+            return False
     else:
-        print(f"Error: {ARTICLES_DATA_FILE} not found.")
-        return
+        print(f"Error: {articles_file} not found.")
+        return False
     
     # --- Logical Change: Consolidate categories and assign defaults ---
     for article in articles_data:
@@ -2288,6 +2292,7 @@ def main():
     print("- rss.xml (RSS feed)")
     print(f"- {len(articles_data)} article pages")
     print(f"- {len(unique_categories_with_articles)} category pages")
+    return True
 
 if __name__ == "__main__":
     main()
@@ -22,7 +22,9 @@ from eeat_site_enhancements import (
     generate_eeat_author_box,
     generate_eeat_trust_indicators, 
     generate_eeat_transparency_section,
-    generate_eeat_structured_data
+    generate_eeat_structured_data,
+    EEAT_STYLESHEET,
+    EEAT_STYLESHEET_FILE
 )
 
 # Use the same configuration as the main generateSite.py
@@ -69,6 +71,11 @@ def copy_static_assets():
         if os.path.exists(asset):
             shutil.copy2(asset, os.path.join(OUTPUT_DIR, asset))
             print(f"📁 Copied {asset}")
+    
+    # Shared E-E-A-T badge styles, linked from every article page
+    with open(os.path.join(OUTPUT_DIR, EEAT_STYLESHEET_FILE), 'w', encoding='utf-8') as f:
+        f.write(EEAT_STYLESHEET)
+    print(f"📁 Wrote {EEAT_STYLESHEET_FILE}")
 
 def load_enhanced_articles():
     """Load E-E-A-T enhanced articles"""
@@ -379,6 +386,7 @@ def generate_eeat_article_pages(articles_data):
     <meta property="article:modified_time" content="{article.get('dateModified', '')}T12:00:00Z">
     
     <script src="https://cdn.tailwindcss.com"></script>
+    <link rel="stylesheet" href="../{EEAT_STYLESHEET_FILE}">
 </head>
 <body class="bg-gray-50">
     <!-- E-E-A-T Trust Header -->
@@ -401,7 +409,7 @@ def generate_eeat_article_pages(articles_data):
                     <span class="text-gray-500">Last Updated: {article.get('lastFactCheck', datetime.now().strftime('%Y-%m-%d'))}</span>
                 </div>
                 <div class="flex items-center space-x-2">
-                    <span class="bg-green-100 text-green-800 text-xs px-2 py-1 rounded">Verified Sources</span>
+                    <span class="eeat-badge eeat-badge--green">Verified Sources</span>
                 </div>
             </div>
         </div>
@@ -450,7 +458,7 @@ def generate_eeat_article_pages(articles_data):
                             <div>
                                 <div class="flex items-center">
                                     <span class="font-semibold text-blue-700">{article.get('authorProfile', {}).get('name', article.get('author', 'Editorial Team'))}</span>
-                                    <span class="bg-green-100 text-green-800 text-xs px-2 py-1 rounded ml-2">✓ Verified Expert</span>
+                                    <span class="eeat-badge eeat-badge--green">✓ Verified Expert</span>
                                 </div>
                                 <div class="text-xs text-gray-500">{article.get('authorProfile', {}).get('title', 'Senior Editor')}</div>
                             </div>
@@ -12,13 +12,11 @@ def main():
     print("ℹ️  Use: python super_article_manager.py enhance --all")
     
     manager = SuperArticleManager()
-    manager.load_articles()
     manager.create_backup("enhance")
     
-    # Run enhancement
-    enhanced = manager.enhance_articles()
+    # Run enhancement, streaming the file rather than loading every article
+    enhanced = manager.enhance_articles_file()
     if enhanced > 0:
-        manager.save_articles()
         print(f"✅ Enhanced {enhanced} articles")
     else:
         print("ℹ️  No articles needed enhancement")
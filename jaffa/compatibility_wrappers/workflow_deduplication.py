@@ -32,8 +32,11 @@ def main():
     # Enhance
     enhanced = manager.enhance_articles()
     
-    # Save
-    manager.save_articles()
+    # Save (skip the rewrite when nothing changed)
+    if merged or removed or fixed or enhanced:
+        manager.save_articles()
+    else:
+        print("ℹ️  No changes - articles file left untouched")
     
     print("\n🎉 Workflow completed!")
     print(f"📊 Summary: Merged {merged}, Removed {removed} dupes, Fixed {fixed}, Enhanced {enhanced}")
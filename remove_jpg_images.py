@@ -9,6 +9,28 @@ import os
 import sys
 from pathlib import Path
 
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+def _iter_image_entries(directory):
+    """
+    Yield os.DirEntry objects for the JPG/PNG files under directory.
+    
+    A scandir walk: each entry's stat() reuses the directory read where it can,
+    and symlinked directories are not descended into (same as os.walk).
+    """
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                        yield entry
+        except OSError:
+            continue
+
 def find_and_remove_jpg_images(directories_to_clean):
     """
     Find and remove JPG/PNG images that have corresponding WebP files
@@ -81,14 +103,11 @@ def get_directory_size(directory):
     if not os.path.exists(directory):
         return 0
         
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.lower().endswith(('.jpg', '.jpeg', '.png')):
-                try:
-                    file_path = os.path.join(root, file)
-                    total_size += os.path.getsize(file_path)
-                except:
-                    pass
+    for entry in _iter_image_entries(directory):
+        try:
+            total_size += entry.stat().st_size
+        except OSError:
+            pass
     return total_size
 
 def main():
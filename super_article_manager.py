@@ -16,19 +16,33 @@ One script to rule them all! 🚀
 
 import os
 import re
+import sys
 import json
 import math
 import uuid
+import shutil
 import aiohttp
 import asyncio
 import argparse
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from dotenv import load_dotenv
 from typing import List, Dict, Tuple, Optional, Union
 from urllib.parse import quote
 from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 import random
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Local imports
 from getTrendInput import get_top_region_keywords
 from generateImage import generateImage
@@ -48,6 +62,8 @@ DEFAULT_VIEWS_COUNT = 0
 DEFAULT_SHARES_COUNT = 0
 DEFAULT_COMMENTS_COUNT = 0
 DEFAULT_AVERAGE_RATING = 0.0
+# Below this many articles a process pool costs more than it saves
+PARALLEL_MIN_ARTICLES = 500
 OUTPUT_DIR = "dist"
 IMAGES_BASE_DIR = os.path.join(OUTPUT_DIR, "images")
 
@@ -58,8 +74,56 @@ IMAGES_BACKUP_DIR = "images_backup"  # Local backup directory outside dist/
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
 
+# Patterns used on every article; compiled once at import
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[-\s]+")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_PARAGRAPH = re.compile(r'(<p[^>]*>.*?</p>)', re.IGNORECASE | re.DOTALL)
+_PLACEMENT_PARAGRAPH = re.compile(r"paragraph\s*(\d+)")
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters but str.lower() does not
+# map to them (dotless i, long s, dotted capital I)
+_ASCII_CASE_SPECIALS = ('\u0131', '\u017f', '\u0130')
+
+# ASCII slug table: word chars lowercased, whitespace/hyphens to spaces, everything else dropped
+_ASCII_SLUG_TABLE = {
+    c: (chr(c).lower() if chr(c).isalnum() or c == ord('_')
+        else ' ' if chr(c) == '-' or chr(c).isspace() else None)
+    for c in range(128)
+}
+
+# Defaults filled in by _enhance_article for any field an article lacks
+_ARTICLE_DEFAULTS = {
+    'keyTakeaways': [],
+    'socialMediaHashtags': [],
+    'callToActionText': 'Stay informed with the latest news and updates!',
+    'adDensity': DEFAULT_AD_DENSITY,
+    'language': DEFAULT_LANGUAGE,
+    'viewsCount': DEFAULT_VIEWS_COUNT,
+    'sharesCount': DEFAULT_SHARES_COUNT,
+    'commentsCount': DEFAULT_COMMENTS_COUNT,
+    'averageRating': DEFAULT_AVERAGE_RATING,
+    'featured': False,
+    'factCheckedBy': DEFAULT_FACT_CHECKED_BY,
+    'editorReviewedBy': DEFAULT_EDITOR_REVIEWED_BY
+}
+_ARTICLE_DEFAULT_FIELDS = frozenset(_ARTICLE_DEFAULTS)
+
 # === UTILITY FUNCTIONS ===
 
+def _json_loads(data):
+    """Parse JSON from str/bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps_bytes(obj, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON (2-space indented unless indent=False), using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
 def sanitize_date_format(date_str):
     """Ensure date is in proper YYYY-MM-DD format for sitemaps"""
     if not date_str:
@@ -70,10 +134,10 @@ def sanitize_date_format(date_str):
         date_str = date_str[:-1]
     
     # Check if it's already in correct format
-    if len(date_str) == 10 and date_str.count('-') == 2:
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
         try:
-            # Validate it's a real date
-            datetime.strptime(date_str, '%Y-%m-%d')
+            # Validate it's a real date (fromisoformat is far cheaper than strptime)
+            date.fromisoformat(date_str)
             return date_str
         except ValueError:
             pass
@@ -85,13 +149,20 @@ def generate_slug(title: str) -> str:
     """Generate URL-friendly slug from title"""
     if not title:
         return ""
-    slug = re.sub(r"[^\w\s-]", "", title).strip().lower()
-    slug = re.sub(r"[-\s]+", "-", slug)
+    if title.isascii():
+        # Single translate pass, no regex; same result as the general path below
+        return '-'.join(title.translate(_ASCII_SLUG_TABLE).split())
+    slug = _SLUG_STRIP.sub("", title).strip().lower()
+    slug = _SLUG_DASH.sub("-", slug)
     return slug.strip('-')
 
+def _strip_html(content: str) -> str:
+    """Remove HTML tags, skipping the regex for tag-free text"""
+    return _HTML_TAG.sub('', content) if '<' in content else content
+
 def estimate_reading_time(content: str) -> Tuple[int, int]:
     """Estimate reading time and word count from HTML content"""
-    clean_content = re.sub(r"<[^>]+>", "", content)
+    clean_content = _strip_html(content)
     words = len(clean_content.split())
     reading_time = math.ceil(words / 200)  # 200 words per minute
     return reading_time, words
@@ -104,15 +175,38 @@ def generate_placeholder_image_url(text: str, width: int = 1200, height: int = 6
 
 def embed_inline_images(html_content: str, inline_images: List[Dict]) -> str:
     """Embed inline images into HTML content"""
-    content = html_content
+    # Paragraph ends are found once in the original HTML; inserted <img> tags never form
+    # new paragraphs, so the positions stay valid for every image
+    paragraph_ends = [m.end() for m in _PARAGRAPH.finditer(html_content)]
+    insertions = []
+    trailing_tags = []
     for img in inline_images:
-        paragraphs = list(re.finditer(r'(<p[^>]*>.*?</p>)', content, re.IGNORECASE | re.DOTALL))
-        match = re.search(r"paragraph\s*(\d+)", img.get("placementHint", ""))
+        match = _PLACEMENT_PARAGRAPH.search(img.get("placementHint", ""))
         n = int(match.group(1)) if match else 2
-        insert_at = paragraphs[n-1].end() if len(paragraphs) >= n else len(content)
         img_tag = f'<img src="{img["url"]}" alt="{img["alt"]}" style="max-width:100%;" />'
-        content = content[:insert_at] + img_tag + content[insert_at:]
-    return content
+        if len(paragraph_ends) >= n:
+            insertions.append((paragraph_ends[n-1], img_tag))
+        else:
+            # No such paragraph: append after everything else
+            trailing_tags.append(img_tag)
+    
+    # Build the result in one pass over sorted offsets instead of re-slicing the whole
+    # document per image; a later image for the same paragraph lands directly after the
+    # paragraph, ahead of earlier ones
+    parts = []
+    prev = 0
+    for insert_at, img_tag in sorted(reversed(insertions), key=lambda item: item[0]):
+        parts.append(html_content[prev:insert_at])
+        parts.append(img_tag)
+        prev = insert_at
+    parts.append(html_content[prev:])
+    parts.extend(trailing_tags)
+    return ''.join(parts)
+
+@lru_cache(maxsize=4096)
+def _title_pattern(title: str):
+    """Compiled whole-word, case-insensitive pattern for a title, reused across articles"""
+    return re.compile(r"\b" + re.escape(title) + r"\b", re.IGNORECASE)
 
 def add_internal_links(content_html: str, all_titles_map: Dict[str, str], 
                       current_slug: str, max_links: int = 3) -> str:
@@ -122,17 +216,25 @@ def add_internal_links(content_html: str, all_titles_map: Dict[str, str],
     sorted_titles = sorted([t for t in all_titles_map if all_titles_map[t] != current_slug], 
                           key=len, reverse=True)
     
+    # Most titles do not occur in the article at all; for ASCII titles a plain substring test
+    # on the lowercased text rules them out without building and running a regex per title
+    lowered = linked_content.lower()
+    can_prefilter = not any(c in linked_content for c in _ASCII_CASE_SPECIALS)
+    
     for title in sorted_titles:
         if links_added >= max_links:
             break
-        pattern = r"\b" + re.escape(title) + r"\b"
-        if re.search(pattern, linked_content, re.IGNORECASE):
+        if can_prefilter and title.isascii() and title.lower() not in lowered:
+            continue
+        pattern = _title_pattern(title)
+        if pattern.search(linked_content):
             slug = all_titles_map[title]
             link_tag = f'<a href="/articles/{slug}.html" class="text-blue-600 hover:underline font-semibold">{title}</a>'
-            linked_content, count = re.subn(pattern, link_tag, linked_content, 
-                                          count=1, flags=re.IGNORECASE)
+            linked_content, count = pattern.subn(link_tag, linked_content, count=1)
             if count > 0:
                 links_added += 1
+                lowered = linked_content.lower()
+                can_prefilter = not any(c in linked_content for c in _ASCII_CASE_SPECIALS)
     return linked_content
 
 def expand_keywords(base_keyword: str, region: str) -> List[str]:
@@ -161,11 +263,16 @@ def generate_excerpt(content: str, max_length: int = 160) -> str:
     """Generate an excerpt from content, optimized for meta descriptions"""
     if not content:
         return ""
-    clean_content = re.sub(r'<[^>]+>', '', content)
-    sentences = clean_content.split('. ')
-    excerpt = sentences[0]
-    if len(excerpt) < 80 and len(sentences) > 1:
-        excerpt += '. ' + sentences[1]
+    clean_content = _strip_html(content)
+    # Locate only the first one or two sentence breaks instead of splitting the whole text
+    end = clean_content.find('. ')
+    if end == -1:
+        excerpt = clean_content
+    else:
+        excerpt = clean_content[:end]
+        if len(excerpt) < 80:
+            second_end = clean_content.find('. ', end + 2)
+            excerpt = clean_content[:second_end] if second_end != -1 else clean_content
     if len(excerpt) > max_length:
         excerpt = excerpt[:max_length-3] + '...'
     return excerpt.strip()
@@ -234,7 +341,6 @@ def backup_images(slug: str, image_files: List[str]) -> List[str]:
             backup_path = os.path.join(backup_dir, filename)
             
             try:
-                import shutil
                 shutil.copy2(image_file, backup_path)
                 backed_up_files.append(backup_path)
                 print(f"📁 Backed up image: {filename} → {backup_path}")
@@ -316,10 +422,8 @@ class SuperArticleManager:
         
         try:
             if os.path.exists(self.articles_file):
-                with open(self.articles_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                with open(backup_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                # Byte copy of the file as-is; no need to parse and re-serialize it
+                shutil.copyfile(self.articles_file, backup_file)
                 self.backup_files.append(backup_file)
                 print(f"📁 Backup created: {backup_file}")
                 return backup_file
@@ -334,8 +438,8 @@ class SuperArticleManager:
             return [], {}, set()
             
         try:
-            with open(self.articles_file, 'r', encoding='utf-8') as f:
-                self.articles = json.load(f)
+            with open(self.articles_file, 'rb') as f:
+                self.articles = _json_loads(f.read())
                 
             print(f"✅ Loaded {len(self.articles)} existing articles")
             self.stats['original_count'] = len(self.articles)
@@ -359,18 +463,22 @@ class SuperArticleManager:
             return [], {}, set()
     
     def save_articles(self, articles_map: Dict[str, Dict] = None) -> bool:
-        """Save articles to JSON file"""
+        """Save articles to JSON file (written to a temp file and swapped in, so a failed save never truncates it)"""
+        tmp_file = self.articles_file + '.tmp'
         try:
             if articles_map is None:
                 articles_map = self.articles_map
             
             articles_list = list(articles_map.values())
-            with open(self.articles_file, 'w', encoding='utf-8') as f:
-                json.dump(articles_list, f, indent=4, ensure_ascii=False)
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps_bytes(articles_list))
+            os.replace(tmp_file, self.articles_file)
             print(f"💾 Saved {len(articles_list)} articles to {self.articles_file}")
             self.stats['final_count'] = len(articles_list)
             return True
         except Exception as e:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
             print(f"❌ Error saving articles: {e}")
             return False
     
@@ -432,6 +540,7 @@ class SuperArticleManager:
         print("\n🗑️  Removing duplicate articles...")
         
         articles_to_remove = set()
+        removal_log = []
         
         for dup_type, groups in duplicates.items():
             for key, indices in groups.items():
@@ -451,7 +560,10 @@ class SuperArticleManager:
                 # Mark others for removal
                 for score, idx, article in scored_articles[1:]:
                     articles_to_remove.add(idx)
-                    print(f"   Removing duplicate: {article.get('title', 'No title')[:50]}...")
+                    removal_log.append(f"   Removing duplicate: {article.get('title', 'No title')[:50]}...\n")
+        
+        # One write for the whole list instead of a print per article
+        sys.stdout.write(''.join(removal_log))
         
         # Remove duplicates (in reverse order to maintain indices)
         for idx in sorted(articles_to_remove, reverse=True):
@@ -463,83 +575,143 @@ class SuperArticleManager:
         
         return removed_count
     
-    def enhance_articles(self) -> int:
-        """Enhance articles with missing fields and better metadata"""
+    @staticmethod
+    def _enhance_article(article: Dict, base_date: datetime, random_days: Optional[int] = None) -> bool:
+        """Fill in missing fields on one article in place; True if anything changed"""
+        original_article = article.copy()
+        # Strip tags once; the excerpt and reading time both work on the plain text
+        plain_content = _strip_html(article['content']) if article.get('content') else ''
+        
+        # Generate missing slug
+        if not article.get('slug') and article.get('title'):
+            article['slug'] = generate_slug(article['title'])
+        
+        # Generate missing excerpt
+        if not article.get('excerpt') and article.get('content'):
+            article['excerpt'] = generate_excerpt(plain_content)
+        
+        # Add missing dates
+        generated_date = None
+        if not article.get('publishDate'):
+            # Random date within last 30 days
+            if random_days is None:
+                random_days = random.randint(0, 30)
+            pub_date = base_date + timedelta(days=random_days)
+            generated_date = pub_date.strftime('%Y-%m-%d')
+            article['publishDate'] = generated_date
+        
+        if not article.get('dateModified'):
+            # A date generated above is already well-formed; otherwise publishDate is set and
+            # non-empty here, so no fallback date needs formatting
+            article['dateModified'] = generated_date or sanitize_date_format(article['publishDate'])
+        else:
+            article['dateModified'] = sanitize_date_format(article['dateModified'])
+        
+        # Ensure publishDate is also properly formatted
+        if article.get('publishDate') and generated_date is None:
+            article['publishDate'] = sanitize_date_format(article['publishDate'])
+        
+        # Add missing author
+        if not article.get('author'):
+            article['author'] = DEFAULT_AUTHOR
+        
+        # Calculate reading time
+        if article.get('content'):
+            reading_time, word_count = estimate_reading_time(plain_content)
+            article['readingTimeMinutes'] = reading_time
+            article['wordCount'] = word_count
+        
+        # Generate missing meta description
+        if not article.get('metaDescription') and article.get('excerpt'):
+            article['metaDescription'] = article['excerpt'][:160]
+        
+        # Add missing structured data
+        if not article.get('structuredData'):
+            article['structuredData'] = generate_structured_data(article)
+        
+        # Add missing fields with defaults (one key-set check skips this for complete articles)
+        if not _ARTICLE_DEFAULT_FIELDS <= article.keys():
+            for field, default_value in _ARTICLE_DEFAULTS.items():
+                if field not in article:
+                    # Lists are copied so articles never share a mutable default
+                    article[field] = default_value.copy() if isinstance(default_value, list) else default_value
+        
+        return article != original_article
+    
+    def enhance_articles(self, workers: int = 1) -> int:
+        """Enhance articles with missing fields and better metadata (workers > 1 uses a process pool)"""
         print("\n✨ Enhancing articles...")
         
         enhanced_count = 0
         base_date = datetime.now() - timedelta(days=30)
         
-        for i, article in enumerate(self.articles):
-            original_article = article.copy()
-            
-            # Generate missing slug
-            if not article.get('slug') and article.get('title'):
-                article['slug'] = generate_slug(article['title'])
-            
-            # Generate missing excerpt
-            if not article.get('excerpt') and article.get('content'):
-                article['excerpt'] = generate_excerpt(article['content'])
-            
-            # Add missing dates
-            if not article.get('publishDate'):
-                # Random date within last 30 days
-                random_days = random.randint(0, 30)
-                pub_date = base_date + timedelta(days=random_days)
-                article['publishDate'] = pub_date.strftime('%Y-%m-%d')
-            
-            if not article.get('dateModified'):
-                article['dateModified'] = sanitize_date_format(article.get('publishDate', datetime.now().strftime('%Y-%m-%d')))
+        if workers <= 1 or len(self.articles) < PARALLEL_MIN_ARTICLES:
+            for article in self.articles:
+                if self._enhance_article(article, base_date):
+                    enhanced_count += 1
+        else:
+            # Draw publish-date offsets here, in article order, so results match a serial run
+            tasks = [(article, base_date, None if article.get('publishDate') else random.randint(0, 30))
+                     for article in self.articles]
+            chunksize = max(1, min(64, len(tasks) // (4 * workers)))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for article, (enhanced, changed) in zip(self.articles,
+                                                        executor.map(_enhance_article_worker, tasks, chunksize=chunksize)):
+                    # Enhancement only adds or overwrites keys; update in place keeps articles_map valid
+                    article.update(enhanced)
+                    if changed:
+                        enhanced_count += 1
+        
+        self.stats['enhancements_applied'] = enhanced_count
+        print(f"✅ Enhanced {enhanced_count} articles")
+        return enhanced_count
+    
+    def _iter_articles_file(self):
+        """Yield articles from the articles file one at a time (streamed when ijson is available)"""
+        if ijson is None:
+            with open(self.articles_file, 'rb') as f:
+                yield from _json_loads(f.read())
+            return
+        with open(self.articles_file, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    
+    def enhance_articles_file(self, output_file: str = None) -> int:
+        """Enhance the articles file article-by-article without holding the corpus in memory"""
+        output_file = output_file or self.articles_file
+        if not os.path.exists(self.articles_file):
+            print(f"ℹ️  {self.articles_file} not found. Nothing to enhance.")
+            return 0
+        print(f"\n✨ Enhancing articles in {self.articles_file}...")
+        
+        enhanced_count = 0
+        total = 0
+        base_date = datetime.now() - timedelta(days=30)
+        # Same layout as save_articles() writes for the whole list; swapped in with os.replace once complete
+        tmp_file = output_file + '.tmp'
+        try:
+            with open(tmp_file, 'wb') as out:
+                out.write(b'[')
+                for article in self._iter_articles_file():
+                    if self._enhance_article(article, base_date):
+                        enhanced_count += 1
+                    out.write(b',\n  ' if total else b'\n  ')
+                    out.write(_json_dumps_bytes(article).replace(b'\n', b'\n  '))
+                    total += 1
+                out.write(b'\n]' if total else b']')
+            if enhanced_count or output_file != self.articles_file:
+                os.replace(tmp_file, output_file)
+                print(f"💾 Saved {total} articles to {output_file}")
             else:
-                article['dateModified'] = sanitize_date_format(article['dateModified'])
-            
-            # Ensure publishDate is also properly formatted
-            if article.get('publishDate'):
-                article['publishDate'] = sanitize_date_format(article['publishDate'])
-            
-            # Add missing author
-            if not article.get('author'):
-                article['author'] = DEFAULT_AUTHOR
-            
-            # Calculate reading time
-            if article.get('content'):
-                reading_time, word_count = estimate_reading_time(article['content'])
-                article['readingTimeMinutes'] = reading_time
-                article['wordCount'] = word_count
-            
-            # Generate missing meta description
-            if not article.get('metaDescription') and article.get('excerpt'):
-                article['metaDescription'] = article['excerpt'][:160]
-            
-            # Add missing structured data
-            if not article.get('structuredData'):
-                article['structuredData'] = generate_structured_data(article)
-            
-            # Add missing fields with defaults
-            defaults = {
-                'keyTakeaways': [],
-                'socialMediaHashtags': [],
-                'callToActionText': 'Stay informed with the latest news and updates!',
-                'adDensity': DEFAULT_AD_DENSITY,
-                'language': DEFAULT_LANGUAGE,
-                'viewsCount': DEFAULT_VIEWS_COUNT,
-                'sharesCount': DEFAULT_SHARES_COUNT,
-                'commentsCount': DEFAULT_COMMENTS_COUNT,
-                'averageRating': DEFAULT_AVERAGE_RATING,
-                'featured': False,
-                'factCheckedBy': DEFAULT_FACT_CHECKED_BY,
-                'editorReviewedBy': DEFAULT_EDITOR_REVIEWED_BY
-            }
-            
-            for field, default_value in defaults.items():
-                if field not in article:
-                    article[field] = default_value
-            
-            # Check if article was actually enhanced
-            if article != original_article:
-                enhanced_count += 1
+                os.remove(tmp_file)
+        except Exception as e:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            print(f"❌ Error enhancing {self.articles_file}: {e}")
+            return 0
         
+        self.stats['original_count'] = total
         self.stats['enhancements_applied'] = enhanced_count
+        self.stats['final_count'] = total
         print(f"✅ Enhanced {enhanced_count} articles")
         return enhanced_count
     
@@ -585,8 +757,8 @@ class SuperArticleManager:
         print("\n🔄 Merging legacy articles...")
         
         try:
-            with open(LEGACY_ARTICLES_FILE, 'r', encoding='utf-8') as f:
-                legacy_articles = json.load(f)
+            with open(LEGACY_ARTICLES_FILE, 'rb') as f:
+                legacy_articles = _json_loads(f.read())
             
             merged_count = 0
             existing_slugs = {a.get('slug') for a in self.articles if a.get('slug')}
@@ -654,6 +826,12 @@ class SuperArticleManager:
                 if value > 0:
                     print(f"   {key.replace('_', ' ').title()}: {value}")
 
+def _enhance_article_worker(task: Tuple[Dict, datetime, Optional[int]]) -> Tuple[Dict, bool]:
+    """Process-pool entry point: enhance one article and return it with its changed flag"""
+    article, base_date, random_days = task
+    changed = SuperArticleManager._enhance_article(article, base_date, random_days)
+    return article, changed
+
 # === ARTICLE GENERATION (from original article_generator.py) ===
 
 class ArticleGenerator:
@@ -762,13 +940,13 @@ class ArticleGenerator:
         url = f"{GEMINI_API_URL}?key={self.api_key}"
         
         try:
-            async with session.post(url, headers=headers, data=json.dumps(payload)) as resp:
+            async with session.post(url, headers=headers, data=_json_dumps_bytes(payload, indent=False)) as resp:
                 if resp.status != 200:
                     error_text = await resp.text()
                     print(f"❌ API error {resp.status} for '{keyword}': {error_text}")
                     return None
                     
-                result = await resp.json()
+                result = await resp.json(loads=_json_loads)
                 
                 if not (result.get("candidates") and 
                        result["candidates"][0].get("content") and 
@@ -777,34 +955,45 @@ class ArticleGenerator:
                     return None
 
                 gen_str = result["candidates"][0]["content"]["parts"][0]["text"]
-                data = json.loads(gen_str)
+                data = _json_loads(gen_str)
                 
                 # Generate article metadata
-                now = sanitize_date_format(datetime.now().strftime("%Y-%m-%d"))
+                # Freshly formatted, so already a valid YYYY-MM-DD date
+                now = datetime.now().strftime("%Y-%m-%d")
                 slug = generate_slug(data['title'])
+                article_url = f"https://countrysnews.com/articles/{slug}.html"
                 reading_time, word_count = estimate_reading_time(data['content'])
                 
                 # Create images directory
                 os.makedirs(os.path.join(IMAGES_BASE_DIR, slug), exist_ok=True)
                 
-                # Generate main image
+                # Image prompts and target files: main image, thumbnail, then the inline images
                 og_image_prompt = f"Professional news article image for: {data['ogTitle']}. Visual style: {data['imageAltText']}. High quality, news-appropriate."
                 og_img_fp = os.path.join(IMAGES_BASE_DIR, slug, "main.webp")
-                og_image_url = generateImage(og_image_prompt, og_img_fp) or generate_placeholder_image_url(data['ogTitle'])
-                
-                # Generate thumbnail image
                 thumb_image_prompt = f"Thumbnail for news article: {data['ogTitle']}. Compact, visually appealing, news-style thumbnail."
                 thumb_img_fp = os.path.join(IMAGES_BASE_DIR, slug, "thumb.webp")
-                thumbnail_url = generateImage(thumb_image_prompt, thumb_img_fp) or generate_placeholder_image_url(data['ogTitle'], 400, 200)
                 
-                # Generate inline images
-                inline_images_list = []
                 inline_image_descs = data.get("inlineImageDescriptions", [])
+                inline_jobs = [
+                    (f"Supporting image for article section: {img_desc['description']}. Caption context: {img_desc['caption']}. Professional, high-quality.",
+                     os.path.join(IMAGES_BASE_DIR, slug, f"inline_{i+1}.webp"))
+                    for i, img_desc in enumerate(inline_image_descs)
+                ]
                 
-                for i, img_desc in enumerate(inline_image_descs):
-                    inline_prompt = f"Supporting image for article section: {img_desc['description']}. Caption context: {img_desc['caption']}. Professional, high-quality."
-                    inline_fp = os.path.join(IMAGES_BASE_DIR, slug, f"inline_{i+1}.webp")
-                    inline_url = generateImage(inline_prompt, inline_fp) or generate_placeholder_image_url(
+                # generateImage is a blocking API call; run all of this article's images in worker
+                # threads at once so they overlap with each other and with the other articles
+                og_image_url, thumbnail_url, *inline_urls = await asyncio.gather(
+                    asyncio.to_thread(generateImage, og_image_prompt, og_img_fp),
+                    asyncio.to_thread(generateImage, thumb_image_prompt, thumb_img_fp),
+                    *(asyncio.to_thread(generateImage, prompt, fp) for prompt, fp in inline_jobs)
+                )
+                og_image_url = og_image_url or generate_placeholder_image_url(data['ogTitle'])
+                thumbnail_url = thumbnail_url or generate_placeholder_image_url(data['ogTitle'], 400, 200)
+                
+                # Collect inline images
+                inline_images_list = []
+                for i, (img_desc, inline_url) in enumerate(zip(inline_image_descs, inline_urls)):
+                    inline_url = inline_url or generate_placeholder_image_url(
                         img_desc.get("description", f"Article Image {i+1}")
                     )
                     
@@ -822,7 +1011,10 @@ class ArticleGenerator:
                 
                 # Expand keywords for better SEO
                 expanded_keywords = expand_keywords(keyword, region)
-                all_keywords = list(set(data['keywords'] + expanded_keywords))
+                # Merge into one set in place rather than concatenating the lists first
+                all_keywords = set(data['keywords'])
+                all_keywords.update(expanded_keywords)
+                all_keywords = list(all_keywords)
                 
                 # Build complete article object
                 article = {
@@ -842,8 +1034,8 @@ class ArticleGenerator:
                     "ogTitle": data['ogTitle'],
                     "ogImage": og_image_url,
                     "imageAltText": data['imageAltText'],
-                    "ogUrl": f"https://countrysnews.com/articles/{slug}.html",
-                    "canonicalUrl": f"https://countrysnews.com/articles/{slug}.html",
+                    "ogUrl": article_url,
+                    "canonicalUrl": article_url,
                     "schemaType": DEFAULT_SCHEMA_TYPE,
                     "readingTimeMinutes": reading_time,
                     "wordCount": word_count,
@@ -1470,6 +1662,8 @@ Examples:
                                help='Merge articles from legacy articles.json')
     enhance_parser.add_argument('--all', action='store_true',
                                help='Run all enhancement operations')
+    enhance_parser.add_argument('--workers', type=int, default=1,
+                               help='Worker processes for enhancement (worth it only for very large files)')
     
     # Workflow command
     workflow_parser = subparsers.add_parser('workflow', help='Complete workflow operations')
@@ -1582,7 +1776,7 @@ async def main():
                     operations_run.append(f"Fixed {fixed} articles")
             
             # Always enhance articles
-            enhanced = manager.enhance_articles()
+            enhanced = manager.enhance_articles(workers=args.workers)
             if enhanced > 0:
                 operations_run.append(f"Enhanced {enhanced} articles")
             
@@ -1597,19 +1791,22 @@ async def main():
                 manager.print_header("COMPLETE WORKFLOW", "=")
                 
                 # Step 1: Merge legacy if exists
-                manager.merge_legacy_articles()
+                changed = manager.merge_legacy_articles()
                 
                 # Step 2: Analyze and deduplicate
                 duplicates = manager.analyze_duplicates()
                 if any(duplicates.values()):
-                    manager.deduplicate_articles(duplicates)
+                    changed += manager.deduplicate_articles(duplicates)
                 
                 # Step 3: Fix issues and enhance
-                manager.fix_article_issues()
-                manager.enhance_articles()
+                changed += manager.fix_article_issues()
+                changed += manager.enhance_articles()
                 
-                # Step 4: Save results
-                manager.save_articles()
+                # Step 4: Save results (skip the rewrite when nothing changed)
+                if changed:
+                    manager.save_articles()
+                else:
+                    print("ℹ️  No changes - articles file left untouched")
                 
                 print("\n🎉 Complete workflow finished!")
             
@@ -87,16 +87,19 @@ def analyze_output_files():
         print("❌ Output directory not found!")
         return
     
-    files = [f for f in os.listdir(output_dir) if f.endswith('.csv')]
-    if not files:
+    # scandir hands back DirEntry objects that cache their stat() result
+    with os.scandir(output_dir) as it:
+        entries = sorted((e for e in it if e.name.endswith('.csv')), key=lambda e: e.name)
+    if not entries:
         print("❌ No CSV files found in output directory!")
         return
     
-    for filename in files:
-        filepath = os.path.join(output_dir, filename)
+    for entry in entries:
+        filename = entry.name
+        filepath = entry.path
         
         # Check file timestamp
-        modified_time = datetime.fromtimestamp(os.path.getmtime(filepath))
+        modified_time = datetime.fromtimestamp(entry.stat().st_mtime)
         age = datetime.now() - modified_time
         
         print(f"\n📄 {filename}:")